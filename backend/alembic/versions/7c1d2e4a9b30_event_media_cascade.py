@@ -0,0 +1,36 @@
+"""event media cascade on event delete
+
+Revision ID: 7c1d2e4a9b30
+Revises: 33e322b7889b
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d2e4a9b30'
+down_revision: Union[str, Sequence[str], None] = '33e322b7889b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('event_media_event_id_fkey', 'event_media', type_='foreignkey')
+    op.create_foreign_key(
+        'event_media_event_id_fkey',
+        'event_media',
+        'events',
+        ['event_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('event_media_event_id_fkey', 'event_media', type_='foreignkey')
+    op.create_foreign_key('event_media_event_id_fkey', 'event_media', 'events', ['event_id'], ['id'])
@@ -0,0 +1,52 @@
+"""geography lookup indexes
+
+Revision ID: a4f8c2d1e6b7
+Revises: 7c1d2e4a9b30
+Create Date: 2026-10-18 10:02:17.550931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f8c2d1e6b7'
+down_revision: Union[str, Sequence[str], None] = '7c1d2e4a9b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uq_village_name_block was declared on the model but never created in the database,
+    # so existing data may break it. Gram panchayats are referenced from complaints, users
+    # and vehicles, so duplicates have to be merged by hand rather than deleted here.
+    duplicates = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT block_id, name, COUNT(*) AS copies
+            FROM gram_panchayats
+            GROUP BY block_id, name
+            HAVING COUNT(*) > 1
+            ORDER BY block_id, name
+            """
+        )
+    ).all()
+    if duplicates:
+        listing = ", ".join(f"block {row.block_id} '{row.name}' x{row.copies}" for row in duplicates)
+        raise RuntimeError(
+            "Cannot add uq_village_name_block: duplicate gram panchayat names within a block "
+            f"({listing}). Rename or merge these rows, then re-run the migration."
+        )
+    op.create_unique_constraint('uq_village_name_block', 'gram_panchayats', ['name', 'block_id'])
+    op.create_index(op.f('ix_complaints_block_id'), 'complaints', ['block_id'], unique=False)
+    op.create_index(op.f('ix_complaints_district_id'), 'complaints', ['district_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_complaints_district_id'), table_name='complaints')
+    op.drop_index(op.f('ix_complaints_block_id'), table_name='complaints')
+    op.drop_constraint('uq_village_name_block', 'gram_panchayats', type_='unique')
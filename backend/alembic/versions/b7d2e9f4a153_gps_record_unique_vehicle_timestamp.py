@@ -0,0 +1,40 @@
+"""gps record unique vehicle timestamp
+
+Revision ID: b7d2e9f4a153
+Revises: f2c4e6a8b031
+Create Date: 2026-10-18 14:02:37.518406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e9f4a153'
+down_revision: Union[str, Sequence[str], None] = 'f2c4e6a8b031'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the first stored copy of each (vehicle_id, timestamp) fix
+    op.execute(
+        """
+        DELETE FROM gps_records a
+        USING gps_records b
+        WHERE a.vehicle_id = b.vehicle_id
+          AND a.timestamp = b.timestamp
+          AND a.id > b.id
+        """
+    )
+    op.drop_index('idx_gps_record_vehicle_timestamp', table_name='gps_records')
+    op.create_index('idx_gps_record_vehicle_timestamp', 'gps_records', ['vehicle_id', 'timestamp'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_gps_record_vehicle_timestamp', table_name='gps_records')
+    op.create_index('idx_gps_record_vehicle_timestamp', 'gps_records', ['vehicle_id', 'timestamp'], unique=False)
@@ -0,0 +1,31 @@
+"""device token fcm_token index
+
+Revision ID: c3e9b5f27d14
+Revises: a4f8c2d1e6b7
+Create Date: 2026-10-18 10:41:05.207613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9b5f27d14'
+down_revision: Union[str, Sequence[str], None] = 'a4f8c2d1e6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_user_device_tokens_fcm_token'), 'user_device_tokens', ['fcm_token'], unique=False)
+    op.create_index(
+        op.f('ix_public_user_device_tokens_fcm_token'), 'public_user_device_tokens', ['fcm_token'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_public_user_device_tokens_fcm_token'), table_name='public_user_device_tokens')
+    op.drop_index(op.f('ix_user_device_tokens_fcm_token'), table_name='user_device_tokens')
@@ -0,0 +1,36 @@
+"""gps record covering index
+
+Revision ID: d4f7b2c8e619
+Revises: b7d2e9f4a153
+Create Date: 2026-10-18 14:52:41.730265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f7b2c8e619'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e9f4a153'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('idx_gps_record_vehicle_timestamp', table_name='gps_records')
+    op.create_index(
+        'idx_gps_record_vehicle_timestamp',
+        'gps_records',
+        ['vehicle_id', 'timestamp'],
+        unique=True,
+        postgresql_include=['latitude', 'longitude', 'speed', 'ignition'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_gps_record_vehicle_timestamp', table_name='gps_records')
+    op.create_index('idx_gps_record_vehicle_timestamp', 'gps_records', ['vehicle_id', 'timestamp'], unique=True)
@@ -0,0 +1,27 @@
+"""gram panchayat district index
+
+Revision ID: d8b1f6a3c925
+Revises: c3e9b5f27d14
+Create Date: 2026-10-18 11:41:05.208374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b1f6a3c925'
+down_revision: Union[str, Sequence[str], None] = 'c3e9b5f27d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_gram_panchayats_district_id'), 'gram_panchayats', ['district_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_gram_panchayats_district_id'), table_name='gram_panchayats')
@@ -0,0 +1,49 @@
+"""vehicle no unique
+
+Revision ID: e8a3c6f1d520
+Revises: d4f7b2c8e619
+Create Date: 2026-10-18 16:24:09.381742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a3c6f1d520'
+down_revision: Union[str, Sequence[str], None] = 'd4f7b2c8e619'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Vehicles were only unique per GP. Existing cross-GP duplicates own GPS history,
+    # so they have to be resolved by hand rather than deleted here.
+    duplicates = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT vehicle_no, COUNT(*) AS copies
+            FROM vehicles
+            GROUP BY vehicle_no
+            HAVING COUNT(*) > 1
+            ORDER BY vehicle_no
+            """
+        )
+    ).all()
+    if duplicates:
+        listing = ", ".join(f"'{row.vehicle_no}' x{row.copies}" for row in duplicates)
+        raise RuntimeError(
+            "Cannot make vehicles.vehicle_no unique: the same vehicle number is registered "
+            f"more than once ({listing}). Merge or remove these vehicles, then re-run the migration."
+        )
+    op.drop_index(op.f('ix_vehicles_vehicle_no'), table_name='vehicles')
+    op.create_index(op.f('ix_vehicles_vehicle_no'), 'vehicles', ['vehicle_no'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_vehicles_vehicle_no'), table_name='vehicles')
+    op.create_index(op.f('ix_vehicles_vehicle_no'), 'vehicles', ['vehicle_no'], unique=False)
@@ -0,0 +1,49 @@
+"""vehicle latest positions
+
+Revision ID: f2c4e6a8b031
+Revises: d8b1f6a3c925
+Create Date: 2026-10-18 13:05:12.664190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c4e6a8b031'
+down_revision: Union[str, Sequence[str], None] = 'd8b1f6a3c925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('vehicle_latest_positions',
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.Column('latitude', sa.Float(), nullable=False),
+    sa.Column('longitude', sa.Float(), nullable=False),
+    sa.Column('speed', sa.Float(), nullable=False),
+    sa.Column('ignition', sa.Boolean(), nullable=False),
+    sa.Column('total_gps_odometer', sa.Float(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('vehicle_id')
+    )
+    # Seed from the existing history so reads are correct before the next ingest
+    op.execute(
+        """
+        INSERT INTO vehicle_latest_positions
+            (vehicle_id, latitude, longitude, speed, ignition, total_gps_odometer, timestamp)
+        SELECT DISTINCT ON (vehicle_id)
+            vehicle_id, latitude, longitude, speed, ignition, total_gps_odometer, timestamp
+        FROM gps_records
+        ORDER BY vehicle_id, timestamp DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('vehicle_latest_positions')
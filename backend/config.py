@@ -9,6 +9,8 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = os.getenv("DATABASE_URL") or "sqlite+aiosqlite:///./test.db"
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE") or 20)
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW") or 10)
 
     # JWT Settings
     jwt_secret_key: str = os.getenv("JWT_SECRET_KEY") or "your-secret-key-here-change-in-production"
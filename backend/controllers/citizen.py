@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     HTTPException,
     status,
@@ -24,7 +25,7 @@ from sqlalchemy.orm import selectinload
 from database import get_db
 from services.auth import AuthService
 from services.complaints import ComplaintService
-from services.fcm_notification_service import notify_workers_on_new_complaint
+from services.fcm_notification_service import notify_workers_on_new_complaint_task
 from services.s3_service import s3_service
 
 from models.database.complaint import Complaint, ComplaintStatus, ComplaintMedia, ComplaintComment
@@ -38,6 +39,7 @@ router = APIRouter()
 
 @router.post("/with-media", response_model=ComplaintResponse)
 async def create_complaint_with_media(
+    background_tasks: BackgroundTasks,
     complaint_type_id: int = Form(...),
     gp_id: int = Form(..., description="Gram Panchayat (village) ID"),
     description: str = Form(..., description="Complaint description"),
@@ -154,7 +156,7 @@ async def create_complaint_with_media(
         else:
             media_details = []
 
-        # Send notification to workers in the village (async, non-blocking)
+        # Send notification to workers in the village once the response is sent
 
         try:
             # Create a ComplaintAssignment entry and notify workers
@@ -174,7 +176,7 @@ async def create_complaint_with_media(
                     pass
             else:
                 logging.warning("No contractor found for village ID %s", gp_id)
-            await notify_workers_on_new_complaint(db, complaint)
+            background_tasks.add_task(notify_workers_on_new_complaint_task, complaint.id)
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Log error but don't fail the request
             traceback.print_exc()
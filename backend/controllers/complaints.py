@@ -5,7 +5,7 @@ import logging
 from typing import Any, Dict, List, Optional
 from datetime import date, datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form, Header, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, File, UploadFile, Form, Header, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -44,7 +44,7 @@ from models.requests.complaint import (
 
 from services.s3_service import s3_service
 from services.auth import AuthService
-from services.fcm_notification_service import notify_user_on_complaint_status_update
+from services.fcm_notification_service import notify_user_on_complaint_status_update_task
 from services.complaints import ComplaintOrderByEnum, ComplaintService
 from services.auth import PublicUserService
 
@@ -317,6 +317,7 @@ async def get_my_complaints(
 async def update_complaint_status(
     complaint_id: int,
     status_request: UpdateComplaintStatusRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_staff_role),  # pylint: disable=unused-argument
 ):
@@ -341,13 +342,8 @@ async def update_complaint_status(
 
     await db.commit()
 
-    # Send notification to the user who created the complaint
-
-    try:
-        await notify_user_on_complaint_status_update(db, complaint, new_status.name)
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        # Log error but don't fail the request
-        logging.error("Failed to send FCM notification: %s", e)
+    # Notify the user who created the complaint once the response is sent
+    background_tasks.add_task(notify_user_on_complaint_status_update_task, complaint.id, new_status.name)
 
     return {"message": "Complaint status updated successfully"}
 
@@ -46,12 +46,6 @@ async def create_event(
         event_create_req.start_time,
         event_create_req.end_time,
     )
-    print("Created Event:")
-    print(event)
-
-    # Refresh the event with media relationship loaded
-    await db.refresh(event, ["media"])
-
     return event
 
 
@@ -108,7 +102,7 @@ async def remove_event_media(
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    await service.remove_event_media(event_media_id)
+    await service.remove_event_media(event_id, event_media_id)
     await db.refresh(event, ["media"])
     return event
 
@@ -17,8 +17,10 @@ engine = create_async_engine(
     DATABASE_URL,
     echo=settings.debug,
     # PostgreSQL-specific configuration
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=1800,
 )
 
 AsyncSessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
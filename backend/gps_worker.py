@@ -0,0 +1,34 @@
+"""Standalone worker that polls the Trackverse API and stores GPS records.
+
+Run exactly one instance next to the API containers:
+
+    python gps_worker.py
+"""
+
+import asyncio
+import logging
+import signal
+
+import models  # noqa: F401  # register every mapper before the first query
+from database import AsyncSessionLocal
+from services.gps_tracking import GPSTrackingService
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    """Run the periodic GPS fetch until SIGINT/SIGTERM."""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, GPSTrackingService.stop_periodic_fetch)
+
+    try:
+        await GPSTrackingService.start_periodic_fetch(AsyncSessionLocal)
+    finally:
+        await GPSTrackingService.close_http_client()
+    logger.info("GPS worker stopped")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main())
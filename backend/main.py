@@ -2,7 +2,6 @@
 
 import os
 import logging
-import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
@@ -19,40 +18,20 @@ from controllers import gps_tracking
 from controllers import feedback
 from controllers import formulae
 from controllers import contractor_analytics
-from database import AsyncSessionLocal, get_db
-from services.gps_tracking import GPSTrackingService
+from config import settings
+from database import engine
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: FastAPI):  # pylint: disable=unused-argument
     """Actions to perform on application startup and shutdown."""
-    # Startup: Start periodic GPS data fetching
+    # GPS polling runs in the separate gps_worker process, so API replicas
+    # do not each poll Trackverse and write duplicate records.
     logger.info("Application starting up...")
-    logger.info("Starting GPS data periodic fetch task...")
-    
-    # Create background task for periodic GPS fetching
-    async for db in get_db():
-        gps_task = asyncio.create_task(GPSTrackingService(db).start_periodic_fetch())
-        
-        yield
-        
-        # Shutdown: Stop GPS fetching task
-        logger.info("Application shutting down...")
-        logger.info("Stopping GPS data periodic fetch task...")
-        GPSTrackingService(db).stop_periodic_fetch()
-    
-    # Wait for the task to complete (with timeout)
-    try:
-        await asyncio.wait_for(gps_task, timeout=5.0)
-    except asyncio.TimeoutError:
-        logger.warning("GPS fetch task did not stop within timeout, cancelling...")
-        gps_task.cancel()
-        try:
-            await gps_task
-        except asyncio.CancelledError:
-            pass
+    yield
+    logger.info("Application shutting down...")
 
 
 fastapi_app = FastAPI(
@@ -66,6 +45,11 @@ fastapi_app = FastAPI(
 from middleware.security import SecurityHeadersMiddleware
 fastapi_app.add_middleware(SecurityHeadersMiddleware)
 
+# Count SQL queries per request in debug mode so N+1 regressions show up in the logs
+if settings.debug:
+    from middleware.query_counter import QueryCounterMiddleware
+    fastapi_app.add_middleware(QueryCounterMiddleware, engine=engine)
+
 # Add CORS middleware
 # Read allowed origins from environment variable, default to "*" for dev
 allowed_origins_str = os.getenv("ALLOWED_ORIGINS", "*")
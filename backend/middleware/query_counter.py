@@ -0,0 +1,51 @@
+"""Development middleware that counts SQL queries per request to surface N+1 regressions."""
+
+import logging
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+from fastapi import Request, Response
+
+logger = logging.getLogger(__name__)
+
+# Holds a one-element list so the count is shared with the task running the endpoint
+_query_count: ContextVar[Optional[List[int]]] = ContextVar("query_count", default=None)
+
+
+def _count_query(*_args, **_kwargs) -> None:
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """Log a warning when a single request issues more than `threshold` queries."""
+
+    def __init__(self, app: ASGIApp, engine: AsyncEngine, threshold: int = 20):
+        super().__init__(app)
+        self.threshold = threshold
+        if not event.contains(engine.sync_engine, "before_cursor_execute", _count_query):
+            event.listen(engine.sync_engine, "before_cursor_execute", _count_query)
+
+    async def dispatch(self, request: Request, call_next):
+        counter = [0]
+        token = _query_count.set(counter)
+        try:
+            response: Response = await call_next(request)
+        finally:
+            _query_count.reset(token)
+
+        response.headers["X-Query-Count"] = str(counter[0])
+        if counter[0] > self.threshold:
+            logger.warning(
+                "%s %s issued %d SQL queries (threshold %d), possible N+1",
+                request.method,
+                request.url.path,
+                counter[0],
+                self.threshold,
+            )
+        return response
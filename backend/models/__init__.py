@@ -58,7 +58,7 @@ from models.database.survey_master import (
     FundSanctioned,
     WorkOrderDetails,
 )
-from models.database.gps import GPSTracking, Vehicle, GPSRecord
+from models.database.gps import GPSTracking, Vehicle, GPSRecord, VehicleLatestPosition
 from models.database.feedback import Feedback
 __all__ = [
     # Auth models
@@ -131,6 +131,7 @@ __all__ = [
     "GPSTracking",
     "GPSRecord",
     "Vehicle",
+    "VehicleLatestPosition",
     # Feedback model
     "Feedback",
 ]
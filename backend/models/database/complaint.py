@@ -83,8 +83,8 @@ class Complaint(Base):  # type: ignore
         Integer, ForeignKey("complaint_types.id"), nullable=False
     )
     gp_id: Mapped[int] = mapped_column(Integer, ForeignKey("gram_panchayats.id"), nullable=False, index=True)  # type: ignore
-    block_id: Mapped[int] = mapped_column(Integer, ForeignKey("blocks.id"), nullable=False)  # type: ignore
-    district_id: Mapped[int] = mapped_column(Integer, ForeignKey("districts.id"), nullable=False)  # type: ignore
+    block_id: Mapped[int] = mapped_column(Integer, ForeignKey("blocks.id"), nullable=False, index=True)  # type: ignore
+    district_id: Mapped[int] = mapped_column(Integer, ForeignKey("districts.id"), nullable=False, index=True)  # type: ignore
     description: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
     mobile_number: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # type: ignore
     public_user_id: Mapped[Optional[int]] = mapped_column(
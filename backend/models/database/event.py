@@ -30,7 +30,12 @@ class Event(Base):  # type: ignore
     end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     active: Mapped[bool] = mapped_column(Boolean, default=True)
 
-    media = relationship("EventMedia", back_populates="event")
+    media = relationship(
+        "EventMedia",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class EventMedia(Base):  # type: ignore
@@ -39,7 +44,9 @@ class EventMedia(Base):  # type: ignore
     __tablename__ = "event_media"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"), nullable=False, index=True)
+    event_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     media_url: Mapped[str] = mapped_column(String, nullable=False)
 
     event = relationship("Event", back_populates="media")
@@ -25,7 +25,7 @@ class UserDeviceToken(Base):  # type: ignore
         Integer, ForeignKey("authority_users.id", ondelete="CASCADE"), nullable=False
     )  # type: ignore
     device_id: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
-    fcm_token: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    fcm_token: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
     device_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # type: ignore
     platform: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # type: ignore # ios, android, web
     created_at: Mapped[datetime] = mapped_column(
@@ -54,7 +54,7 @@ class PublicUserDeviceToken(Base):  # type: ignore
         Integer, ForeignKey("public_users.id", ondelete="CASCADE"), nullable=False
     )  # type: ignore
     device_id: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
-    fcm_token: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    fcm_token: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
     device_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # type: ignore
     platform: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # type: ignore # ios, android, web
     created_at: Mapped[datetime] = mapped_column(
@@ -62,12 +62,9 @@ class GramPanchayat(Base):  # type: ignore
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, nullable=False, index=True)
     block_id: Mapped[int] = mapped_column(Integer, ForeignKey("blocks.id"), nullable=False, index=True)
-    district_id: Mapped[int] = mapped_column(Integer, ForeignKey("districts.id"), nullable=False)
+    district_id: Mapped[int] = mapped_column(Integer, ForeignKey("districts.id"), nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    # Unique constraint on name within block
-    __table_args__ = (UniqueConstraint("name", "block_id", name="uq_village_name_block"),)
-
     # Relationships
     block: Mapped[Block] = relationship("Block", back_populates="villages")
     district: Mapped[District] = relationship("District", back_populates="villages")
@@ -75,8 +72,9 @@ class GramPanchayat(Base):  # type: ignore
     complaints: Mapped[List["Complaint"]] = relationship("Complaint", back_populates="gp")
     vehicles: Mapped[List["Vehicle"]] = relationship("Vehicle", back_populates="gp")
 
-    # Table indexes
+    # Unique constraint on name within block, plus table indexes
     __table_args__ = (
+        UniqueConstraint("name", "block_id", name="uq_village_name_block"),
         Index("ix_gram_panchayat_name", "name"),
         Index("ix_gram_panchayat_block", "block_id"),
     )
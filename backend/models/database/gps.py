@@ -19,7 +19,8 @@ class Vehicle(Base):
 
     id = mapped_column(Integer, primary_key=True, autoincrement=True)
     gp_id: Mapped[int] = mapped_column(Integer, ForeignKey("gram_panchayats.id"), nullable=False, index=True)
-    vehicle_no: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # Trackverse identifies devices by vehicle number alone, so it must be unique across GPs
+    vehicle_no: Mapped[str] = mapped_column(String, nullable=False, index=True, unique=True)
     imei: Mapped[str] = mapped_column(String, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=True)
 
@@ -61,11 +62,38 @@ class GPSRecord(Base):
     )
 
     __table_args__ = (
-        Index("idx_gps_record_vehicle_timestamp", "vehicle_id", "timestamp"),
+        # Unique so overlapping polls cannot store the same fix twice (ingest uses ON CONFLICT DO NOTHING).
+        # The INCLUDE columns let route reads be answered from the index alone.
+        Index(
+            "idx_gps_record_vehicle_timestamp",
+            "vehicle_id",
+            "timestamp",
+            unique=True,
+            postgresql_include=["latitude", "longitude", "speed", "ignition"],
+        ),
         Index("idx_gps_record_vehicle", "vehicle_id"),
         Index("idx_gps_record_timestamp", "timestamp"),
     )
 
+
+class VehicleLatestPosition(Base):
+    """
+    Latest known GPS fix per vehicle, upserted on every ingest
+    """
+
+    __tablename__ = "vehicle_latest_positions"
+
+    vehicle_id: Mapped[int] = mapped_column(Integer, ForeignKey("vehicles.id", ondelete="CASCADE"), primary_key=True)
+    latitude: Mapped[float] = mapped_column(Float, nullable=False)
+    longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    speed: Mapped[float] = mapped_column(Float, nullable=False)
+    ignition: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    total_gps_odometer: Mapped[float] = mapped_column(Float, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    vehicle: Mapped["Vehicle"] = relationship("Vehicle", foreign_keys=[vehicle_id])
+
+
 class GPSTracking(Base):
     """
     Describes a GPS tracking entity
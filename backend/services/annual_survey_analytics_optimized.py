@@ -6,7 +6,7 @@ Handles business logic for annual survey analytics using database-level aggregat
 from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, distinct, and_
+from sqlalchemy import Numeric, cast, select, func, distinct, and_
 from sqlalchemy.orm import selectinload
 
 from models.database.survey_master import (
@@ -31,6 +31,14 @@ from models.response.annual_survey_analytics import (
 )
 
 
+def _coverage_percentage(gps_with_data, total_gps):
+    """Build a SQL expression for the rounded coverage percentage, 0 when there are no GPs."""
+    return func.coalesce(
+        func.round(cast(gps_with_data, Numeric) * 100 / func.nullif(total_gps, 0), 2),
+        0,
+    )
+
+
 class AnnualSurveyAnalyticsServiceOptimized:
     """Optimized service for annual survey analytics using database aggregations."""
 
@@ -583,6 +591,9 @@ class AnnualSurveyAnalyticsServiceOptimized:
                 District.name.label("district_name"),
                 func.count(distinct(GramPanchayat.id)).label("total_gps"),  # type: ignore
                 func.count(distinct(AnnualSurvey.gp_id)).label("gps_with_data"),  # type: ignore
+                _coverage_percentage(
+                    func.count(distinct(AnnualSurvey.gp_id)), func.count(distinct(GramPanchayat.id))
+                ).label("coverage_percentage"),
             )
             .select_from(District)
             .join(GramPanchayat, District.id == GramPanchayat.district_id)
@@ -604,10 +615,8 @@ class AnnualSurveyAnalyticsServiceOptimized:
                 geography_name=row.district_name,
                 total_gps=row.total_gps or 0,
                 gps_with_data=row.gps_with_data or 0,
-                coverage_percentage=round(
-                    (row.gps_with_data / row.total_gps * 100) if row.total_gps and row.total_gps > 0 else 0.0, 2
-                ),
-                master_data_status="Available" if row.gps_with_data and row.gps_with_data > 0 else "Not Available",
+                coverage_percentage=float(row.coverage_percentage),
+                master_data_status="Available" if row.gps_with_data else "Not Available",
             )
             for row in rows
         ]
@@ -627,6 +636,9 @@ class AnnualSurveyAnalyticsServiceOptimized:
                 Block.name.label("block_name"),
                 func.count(distinct(GramPanchayat.id)).label("total_gps"),  # type: ignore
                 func.count(distinct(AnnualSurvey.gp_id)).label("gps_with_data"),  # type: ignore
+                _coverage_percentage(
+                    func.count(distinct(AnnualSurvey.gp_id)), func.count(distinct(GramPanchayat.id))
+                ).label("coverage_percentage"),
             )
             .select_from(Block)
             .join(GramPanchayat, Block.id == GramPanchayat.block_id)
@@ -644,10 +656,8 @@ class AnnualSurveyAnalyticsServiceOptimized:
                 geography_name=row.block_name,
                 total_gps=row.total_gps or 0,
                 gps_with_data=row.gps_with_data or 0,
-                coverage_percentage=round(
-                    (row.gps_with_data / row.total_gps * 100) if row.total_gps and row.total_gps > 0 else 0.0, 2
-                ),
-                master_data_status="Available" if row.gps_with_data and row.gps_with_data > 0 else "Not Available",
+                coverage_percentage=float(row.coverage_percentage),
+                master_data_status="Available" if row.gps_with_data else "Not Available",
             )
             for row in rows
         ]
@@ -3,10 +3,11 @@
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from models.database.event import Event, EventMedia, EventBookmark
 
@@ -33,11 +34,13 @@ class EventService:
         active: bool = True,
     ) -> list[Event]:
         """Retrieve all events with optional pagination and active filter."""
-        query = select(Event).options(selectinload(Event.media)).offset(skip).limit(limit)
+        # joinedload fetches events and media in one query; SQLAlchemy wraps the
+        # paginated events in a subquery so LIMIT/OFFSET still apply per event.
+        query = select(Event).options(joinedload(Event.media)).order_by(Event.id).offset(skip).limit(limit)
         if active:
             query = query.where(Event.active)
         result = await self.db.execute(query)
-        events = result.scalars().all()
+        events = result.unique().scalars().all()
         return list(events)
 
     async def create_event(
@@ -56,7 +59,9 @@ class EventService:
             active=True,
         ).returning(Event))).scalar_one()
         await self.db.commit()
-        await self.db.refresh(event, ["media"])
+        # A freshly inserted event cannot have media yet; mark the collection as
+        # loaded instead of issuing another SELECT to populate it.
+        set_committed_value(event, "media", [])
         return event
 
     async def update_event(
@@ -81,14 +86,25 @@ class EventService:
         if active is not None:
             update_data["active"] = active
 
-        if update_data:
+        if not update_data:
+            return await self.get_event_by_id(event_id)
+
+        # RETURNING hands back the updated row, so only the media collection
+        # still needs to be loaded afterwards.
+        event = (
             await self.db.execute(
-                update(Event).where(Event.id == event_id).values(**update_data),
+                update(Event)
+                .where(Event.id == event_id)
+                .values(**update_data)
+                .returning(Event)
+                .execution_options(populate_existing=True),
             )
-            await self.db.commit()
-
-        # Always return the updated event with media relationship loaded
-        return await self.get_event_by_id(event_id)
+        ).scalar_one_or_none()
+        await self.db.commit()
+        if event is None:
+            return None
+        await self.db.refresh(event, ["media"])
+        return event
 
     async def add_event_media(self, event_id: int, media_url: str) -> None:
         """Add media to an event."""
@@ -97,19 +113,16 @@ class EventService:
         )
         await self.db.commit()
 
-    async def remove_event_media(self, event_media_id: int) -> None:
-        """Remove event media by its ID."""
+    async def remove_event_media(self, event_id: int, event_media_id: int) -> None:
+        """Remove event media by its ID, scoped to the owning event."""
         await self.db.execute(
-            delete(EventMedia).where(EventMedia.id == event_media_id),
+            delete(EventMedia).where(EventMedia.id == event_media_id, EventMedia.event_id == event_id),
         )
         await self.db.commit()
 
     async def delete_event(self, event_id: int) -> None:
         """Delete an event by its ID."""
-        # Delete associated media first due to foreign key constraint
-        await self.db.execute(
-            delete(EventMedia).where(EventMedia.event_id == event_id),
-        )
+        # Associated media rows are removed by the ON DELETE CASCADE foreign key
         await self.db.execute(
             delete(Event).where(Event.id == event_id),
         )
@@ -121,26 +134,19 @@ class EventService:
         user_id: Optional[int] = None,
         public_user_id: Optional[int] = None,
     ) -> EventBookmark:
-        """Add a bookmark for an event."""
-        bookmark = EventBookmark(
-            event_id=event_id, user_id=user_id, public_user_id=public_user_id
+        """Add a bookmark for an event, returning the existing one if already bookmarked."""
+        # The no-op update on conflict makes RETURNING yield the existing row,
+        # so duplicates resolve in a single statement.
+        constraint = "uix_event_user_bookmark" if user_id else "uix_event_public_user_bookmark"
+        stmt = (
+            pg_insert(EventBookmark)
+            .values(event_id=event_id, user_id=user_id, public_user_id=public_user_id)
+            .on_conflict_do_update(constraint=constraint, set_={"event_id": event_id})
+            .returning(EventBookmark)
         )
-        self.db.add(bookmark)
-        try:
-            await self.db.commit()
-            await self.db.refresh(bookmark)
-            return bookmark
-        except IntegrityError:
-            await self.db.rollback()
-            # Bookmark already exists, return existing one
-            query = select(EventBookmark).where(EventBookmark.event_id == event_id)
-            if user_id:
-                query = query.where(EventBookmark.user_id == user_id)
-            if public_user_id:
-                query = query.where(EventBookmark.public_user_id == public_user_id)
-
-            result = await self.db.execute(query)
-            return result.scalar_one()
+        bookmark = (await self.db.execute(stmt)).scalar_one()
+        await self.db.commit()
+        return bookmark
 
     async def remove_bookmark(
         self,
@@ -191,11 +197,10 @@ class EventService:
         public_user_id: Optional[int] = None,
     ) -> bool:
         """Check if an event is bookmarked by a user."""
-        query = select(EventBookmark).where(EventBookmark.event_id == event_id)
+        condition = exists().where(EventBookmark.event_id == event_id)
         if user_id:
-            query = query.where(EventBookmark.user_id == user_id)
+            condition = condition.where(EventBookmark.user_id == user_id)
         if public_user_id:
-            query = query.where(EventBookmark.public_user_id == public_user_id)
+            condition = condition.where(EventBookmark.public_user_id == public_user_id)
 
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return bool(await self.db.scalar(select(condition)))
@@ -2,16 +2,20 @@ import logging
 from typing import List, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import delete, select, and_
 
 from models.database.auth import User, PublicUser
 from models.database.fcm_device import UserDeviceToken, PublicUserDeviceToken
 from models.database.complaint import Complaint
 from models.database.geography import GramPanchayat
+from database import AsyncSessionLocal
 from services.fcm_service import fcm_service
 
 logger = logging.getLogger(__name__)
 
+# Keep IN (...) lists well below driver bind-parameter limits
+_CLEANUP_BATCH_SIZE = 500
+
 
 async def notify_workers_on_new_complaint(
     db: AsyncSession,
@@ -26,14 +30,16 @@ async def notify_workers_on_new_complaint(
     """
     try:
         # Get all users who are workers in this village
-        # We need to find users with WORKER role assigned to this village
+        # We need to find users with WORKER role assigned to this village.
+        # The village name is joined in so no separate lookup is needed.
         from models.database.auth import PositionHolder, Role
 
         result = await db.execute(
-            select(User, UserDeviceToken.fcm_token)
+            select(UserDeviceToken.fcm_token, GramPanchayat.name)
+            .join(User, User.id == UserDeviceToken.user_id)
             .join(PositionHolder, User.id == PositionHolder.user_id)
             .join(Role, PositionHolder.role_id == Role.id)
-            .join(UserDeviceToken, User.id == UserDeviceToken.user_id)
+            .join(GramPanchayat, GramPanchayat.id == PositionHolder.gp_id)
             .where(
                 and_(
                     Role.name == "WORKER",
@@ -50,15 +56,8 @@ async def notify_workers_on_new_complaint(
             logger.info("No workers found for village %d", complaint.gp_id)
             return
 
-        # Collect all FCM tokens
-        tokens = [worker[1] for worker in workers]
-
-        # Get village name for better notification
-        village_result = await db.execute(
-            select(GramPanchayat).where(GramPanchayat.id == complaint.gp_id)
-        )
-        village = village_result.scalar_one_or_none()
-        village_name = village.name if village else "your village"
+        tokens = [worker.fcm_token for worker in workers]
+        village_name = workers[0].name or "your village"
 
         # Send notification
         result = await fcm_service.send_notification(
@@ -109,26 +108,23 @@ async def notify_user_on_complaint_status_update(
 
         # Get public user and their device tokens
         result = await db.execute(
-            select(PublicUser, PublicUserDeviceToken.fcm_token)
+            select(PublicUserDeviceToken.fcm_token)
             .join(
-                PublicUserDeviceToken,
+                PublicUser,
                 PublicUser.id == PublicUserDeviceToken.public_user_id,
             )
             .where(PublicUser.mobile_number == complaint.mobile_number)
             .distinct()
         )
 
-        public_users = result.all()
+        tokens = list(result.scalars().all())
 
-        if not public_users:
+        if not tokens:
             logger.info(
                 f"No public user devices found for mobile {complaint.mobile_number}"
             )
             return
 
-        # Collect all FCM tokens
-        tokens = [user[1] for user in public_users]
-
         # Send notification
         result = await fcm_service.send_notification(
             tokens=tokens,
@@ -156,6 +152,43 @@ async def notify_user_on_complaint_status_update(
         logger.error(f"Error sending notification to public user: {e}")
 
 
+async def notify_workers_on_new_complaint_task(complaint_id: int) -> None:
+    """
+    Background task variant of notify_workers_on_new_complaint
+
+    Runs after the response has been sent, so it opens its own session
+    instead of reusing the (already closed) request session.
+
+    Args:
+        complaint_id: ID of the newly created complaint
+    """
+    async with AsyncSessionLocal() as db:
+        complaint = await db.get(Complaint, complaint_id)
+        if complaint is None:
+            logger.warning("Complaint %d not found, skipping notification", complaint_id)
+            return
+        await notify_workers_on_new_complaint(db, complaint)
+
+
+async def notify_user_on_complaint_status_update_task(
+    complaint_id: int,
+    new_status_name: str,
+) -> None:
+    """
+    Background task variant of notify_user_on_complaint_status_update
+
+    Args:
+        complaint_id: ID of the complaint that was updated
+        new_status_name: The new status name
+    """
+    async with AsyncSessionLocal() as db:
+        complaint = await db.get(Complaint, complaint_id)
+        if complaint is None:
+            logger.warning("Complaint %d not found, skipping notification", complaint_id)
+            return
+        await notify_user_on_complaint_status_update(db, complaint, new_status_name)
+
+
 async def _cleanup_invalid_tokens(
     db: AsyncSession,
     invalid_tokens: List[str],
@@ -170,17 +203,18 @@ async def _cleanup_invalid_tokens(
         model_class: Either UserDeviceToken or PublicUserDeviceToken
     """
     try:
-        for token in invalid_tokens:
+        deleted = 0
+        for start in range(0, len(invalid_tokens), _CLEANUP_BATCH_SIZE):
+            batch = invalid_tokens[start : start + _CLEANUP_BATCH_SIZE]
             result = await db.execute(
-                select(model_class).where(model_class.fcm_token == token)
+                delete(model_class)
+                .where(model_class.fcm_token.in_(batch))
+                .execution_options(synchronize_session=False)
             )
-            device = result.scalar_one_or_none()
-
-            if device:
-                await db.delete(device)
-                logger.info(f"Deleted invalid FCM token: {token[:20]}...")
+            deleted += result.rowcount or 0
 
         await db.commit()
+        logger.info("Deleted %d invalid FCM tokens", deleted)
 
     except Exception as e:
         logger.error(f"Error cleaning up invalid tokens: {e}")
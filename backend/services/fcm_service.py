@@ -1,14 +1,25 @@
 import os
+import asyncio
 import logging
 from typing import List, Dict, Optional
 
 import firebase_admin
 from firebase_admin.credentials import Certificate
-from firebase_admin.messaging import Notification, MulticastMessage, send_multicast # type: ignore
+from firebase_admin.messaging import Notification, MulticastMessage, send_each_for_multicast # type: ignore
 from pydantic import BaseModel # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on multicast batches in flight at once, so a burst of notifications
+# cannot exhaust the default thread pool used by asyncio.to_thread. This limits
+# batches, not HTTP requests: each send_each_for_multicast call still fans out one
+# request per token on the SDK's own worker threads.
+MAX_CONCURRENT_SENDS = 10
+_send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+# FCM rejects multicast messages addressed to more than 500 tokens
+MULTICAST_TOKEN_LIMIT = 500
+
 
 class SendNotificationResponse(BaseModel):
     success_count: int
@@ -20,6 +31,7 @@ class FCMService:
 
     def __init__(self):
         self._initialized = False
+        self._app: Optional[firebase_admin.App] = None
         self._initialize()
 
     def _initialize(self):
@@ -29,6 +41,7 @@ class FCMService:
 
         # Check if already initialized
         if firebase_admin._apps:  # type: ignore
+            self._app = firebase_admin.get_app()
             self._initialized = True
             logger.info("Firebase Admin SDK already initialized")
             return
@@ -39,7 +52,7 @@ class FCMService:
         if fcm_credential_path and os.path.exists(fcm_credential_path):
             try:
                 cred = Certificate(fcm_credential_path) # type: ignore
-                firebase_admin.initialize_app(cred)
+                self._app = firebase_admin.initialize_app(cred)
                 self._initialized = True
                 logger.info(f"Firebase Admin SDK initialized from {fcm_credential_path}")
             except Exception as e:
@@ -60,7 +73,7 @@ class FCMService:
         title: str,
         body: str,
         data: Optional[Dict[str, str]] = None,
-    ) -> SendNotificationResponse       :
+    ) -> SendNotificationResponse:
         """
         Send notification to multiple devices
 
@@ -71,49 +84,67 @@ class FCMService:
             data: Optional custom data payload
 
         Returns:
-            Dictionary with success_count and failure_count
+            SendNotificationResponse with success/failure counts and invalid tokens
         """
         if not self.is_available():
             logger.warning("FCM service not available, skipping notification")
-            return SendNotificationResponse(success_count=0, failure_count=len(tokens), invalid_tokens=tokens)
+            # The tokens were never tried, so none of them are known to be invalid
+            return SendNotificationResponse(success_count=0, failure_count=len(tokens))
 
         if not tokens:
             logger.info("No tokens provided, skipping notification")
             return SendNotificationResponse(success_count=0, failure_count=0)
 
+        notification = Notification(title=title, body=body)
+        payload = data or {}
+        batches = [tokens[i : i + MULTICAST_TOKEN_LIMIT] for i in range(0, len(tokens), MULTICAST_TOKEN_LIMIT)]
+        results = await asyncio.gather(*(self._send_batch(batch, notification, payload) for batch in batches))
+
+        success_count = sum(result.success_count for result in results)
+        failure_count = sum(result.failure_count for result in results)
+        logger.info(f"Sent FCM notification: {success_count} successful, {failure_count} failed")
+
+        return SendNotificationResponse(
+            success_count=success_count,
+            failure_count=failure_count,
+            invalid_tokens=[token for result in results for token in result.invalid_tokens],
+        )
+
+    async def _send_batch(
+        self,
+        tokens: List[str],
+        notification: Notification,
+        data: Dict[str, str],
+    ) -> SendNotificationResponse:
+        """Send one multicast of at most MULTICAST_TOKEN_LIMIT tokens."""
         try:
             message = MulticastMessage(
-                notification=Notification(
-                    title=title,
-                    body=body,
-                ),
-                data=data or {},
+                notification=notification,
+                data=data,
                 tokens=tokens,
             )
 
-            response = send_multicast(message) # type: ignore
+            # The SDK call is a blocking HTTP request; run it off the event loop
+            async with _send_semaphore:
+                response = await asyncio.to_thread(send_each_for_multicast, message, app=self._app) # type: ignore
 
-            # Log invalid tokens
+            # Tokens FCM reports as unregistered can be removed by the caller
+            invalid_tokens: List[str] = []
             if response.failure_count > 0:  # type: ignore
-                invalid_tokens = []
-                for i, result in enumerate(response.responses): # type: ignore
-                    if not result.success and result.exception: # type: ignore
-                        if result.exception.code in ("UNREGISTERED", "NOT_FOUND"): # type: ignore 
-                            invalid_tokens.append(tokens[i]) # type: ignore
-                            logger.warning(f"Invalid token detected: {tokens[i][:20]}...")
-
+                invalid_tokens = [
+                    tokens[i]
+                    for i, result in enumerate(response.responses)  # type: ignore
+                    if not result.success
+                    and result.exception
+                    and result.exception.code in ("UNREGISTERED", "NOT_FOUND")  # type: ignore
+                ]
                 if invalid_tokens:
-                    logger.info(f"Found {len(invalid_tokens)} invalid tokens for cleanup") # type: ignore
-
-            logger.info(
-                f"Sent FCM notification: {response.success_count} successful, " # type: ignore
-                f"{response.failure_count} failed" # type: ignore
-            )
+                    logger.info(f"Found {len(invalid_tokens)} invalid tokens for cleanup")
 
             return SendNotificationResponse(
                 success_count=response.success_count, # type: ignore
                 failure_count=response.failure_count, # type: ignore
-                invalid_tokens=invalid_tokens if response.failure_count > 0 else [], # type: ignore
+                invalid_tokens=invalid_tokens,
             )
 
         except Exception as e:
@@ -137,7 +168,7 @@ class FCMService:
             data: Optional custom data payload
 
         Returns:
-            Dictionary with success_count and failure_count
+            SendNotificationResponse with success/failure counts and invalid tokens
         """
         return await self.send_notification(user_tokens, title, body, data)
 
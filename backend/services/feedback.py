@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 from fastapi import HTTPException
-from sqlalchemy import insert, select
+from sqlalchemy import case, exists, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -24,12 +24,16 @@ class FeedbackService:
         if not auth_user_id and not public_user_id:
             raise ValueError("Either auth_user_id or public_user_id must be provided.")
         # Check if feedback already exists for the user
-        query = select(Feedback).where(
-            (Feedback.auth_user_id == auth_user_id) if auth_user_id else (Feedback.public_user_id == public_user_id)
+        already_exists = await self.db.scalar(
+            select(
+                exists().where(
+                    (Feedback.auth_user_id == auth_user_id)
+                    if auth_user_id
+                    else (Feedback.public_user_id == public_user_id)
+                )
+            )
         )
-        result = await self.db.execute(query)
-        existing_feedback = result.scalar_one_or_none()
-        if existing_feedback:
+        if already_exists:
             raise HTTPException(status_code=400, detail="Feedback already exists for this user.")
 
         feedback = (
@@ -45,7 +49,6 @@ class FeedbackService:
             )
         ).scalar_one()
         await self.db.commit()
-        await self.db.refresh(feedback)
         return feedback
 
     async def get_feedback_by_id(self, feedback_id: int) -> Feedback | None:
@@ -76,35 +79,22 @@ class FeedbackService:
 
     async def count_stats(self) -> FeedbackStatsResponse:
         """Count feedback statistics."""
-        total_feedback_result = await self.db.execute(select(Feedback))
-        total_feedback = total_feedback_result.scalars().all()
-        total_count = len(total_feedback)
-
-        if total_count == 0:
-            return FeedbackStatsResponse(
-                total_feedback=0,
-                average_rating=0.0,
-                auth_user_avg_rating=0.0,
-                public_user_avg_rating=0.0,
+        result = await self.db.execute(
+            select(
+                func.count(Feedback.id),
+                func.avg(Feedback.rating),
+                func.avg(case((Feedback.auth_user_id.isnot(None), Feedback.rating))),
+                func.avg(case((Feedback.public_user_id.isnot(None), Feedback.rating))),
             )
-
-        average_rating = sum(fb.rating for fb in total_feedback) / total_count
-
-        auth_user_feedback = [fb for fb in total_feedback if fb.auth_user_id is not None]
-        public_user_feedback = [fb for fb in total_feedback if fb.public_user_id is not None]
-
-        auth_user_avg_rating = (
-            sum(fb.rating for fb in auth_user_feedback) / len(auth_user_feedback) if auth_user_feedback else 0.0
-        )
-        public_user_avg_rating = (
-            sum(fb.rating for fb in public_user_feedback) / len(public_user_feedback) if public_user_feedback else 0.0
         )
+        total_count, average_rating, auth_user_avg_rating, public_user_avg_rating = result.one()
 
+        # AVG over no rows is NULL; report 0.0 like the empty-table case
         return FeedbackStatsResponse(
             total_feedback=total_count,
-            average_rating=average_rating,
-            auth_user_avg_rating=auth_user_avg_rating,
-            public_user_avg_rating=public_user_avg_rating,
+            average_rating=float(average_rating or 0.0),
+            auth_user_avg_rating=float(auth_user_avg_rating or 0.0),
+            public_user_avg_rating=float(public_user_avg_rating or 0.0),
         )
 
     async def get_user_own_feedback(self, auth_user_id: int | None, public_user_id: int | None) -> Feedback | None:
@@ -1,7 +1,9 @@
+import logging
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, insert
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, exists, or_, select, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import raiseload, selectinload
 from fastapi import HTTPException
 
 from models.database.geography import District, Block, GramPanchayat, Village
@@ -13,6 +15,29 @@ from models.requests.geography import (
     CreateVillageRequest,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Lookup statements are built once and reused with bound ids, saving the
+# select()/where() construction cost on every validation call.
+_DISTRICT_BY_ID = select(District).where(District.id == bindparam("district_id"))
+_BLOCK_BY_ID = select(Block).where(Block.id == bindparam("block_id"))
+_VILLAGE_BY_ID = (
+    select(GramPanchayat)
+    .options(
+        selectinload(GramPanchayat.block),
+        selectinload(GramPanchayat.district),
+        # Any other relationship access would be a hidden lazy load; fail fast instead
+        raiseload("*"),
+    )
+    .where(GramPanchayat.id == bindparam("village_id"))
+)
+
+
+def _count_where(model: Any, condition: Any) -> Any:
+    """Build a scalar COUNT(*) subquery over ``model`` filtered by ``condition``."""
+    return select(func.count()).select_from(model).where(condition).scalar_subquery()
+
 
 class GeographyService:
     """Service layer for geography operations."""
@@ -22,7 +47,7 @@ class GeographyService:
 
     async def validate_district_exists(self, district_id: int) -> District:
         """Validate that a district exists."""
-        result = await self.db.execute(select(District).where(District.id == district_id))
+        result = await self.db.execute(_DISTRICT_BY_ID, {"district_id": district_id})
         district = result.scalar_one_or_none()
         if not district:
             raise HTTPException(status_code=400, detail="District not found")
@@ -34,16 +59,16 @@ class GeographyService:
         district_id: Optional[int] = None,
     ) -> Block:
         """Validate that a block exists and optionally belongs to a district."""
-        query = select(Block).where(Block.id == block_id)
+        query = _BLOCK_BY_ID
         if district_id:
             query = query.where(Block.district_id == district_id)
 
-        result = await self.db.execute(query)
+        result = await self.db.execute(query, {"block_id": block_id})
         block = result.scalar_one_or_none()
 
         if not block:
             if district_id:
-                print(f"Block {block_id} not found in district {district_id}")
+                logger.warning("Block %s not found in district %s", block_id, district_id)
                 raise HTTPException(
                     status_code=400,
                     detail="Block not found or doesn't belong to the specified district",
@@ -55,16 +80,7 @@ class GeographyService:
 
     async def validate_village_exists(self, village_id: int) -> GramPanchayat:
         """Validate that a village exists."""
-        result = await self.db.execute(
-            select(GramPanchayat)
-            .join(Block, GramPanchayat.block_id == Block.id)
-            .join(District, Block.district_id == District.id)
-            .options(
-                selectinload(GramPanchayat.block),
-                selectinload(GramPanchayat.district),
-            )
-            .where(GramPanchayat.id == village_id)
-        )
+        result = await self.db.execute(_VILLAGE_BY_ID, {"village_id": village_id})
         village = result.scalar_one_or_none()
         if not village:
             raise HTTPException(status_code=400, detail="Village not found")
@@ -76,13 +92,11 @@ class GeographyService:
         exclude_id: Optional[int] = None,
     ) -> bool:
         """Check if district name is unique."""
-        query = select(District).where(District.name == name)
+        condition = exists().where(District.name == name)
         if exclude_id:
-            query = query.where(District.id != exclude_id)
+            condition = condition.where(District.id != exclude_id)
 
-        result = await self.db.execute(query)
-        existing = result.scalar_one_or_none()
-        return existing is None
+        return not await self.db.scalar(select(condition))
 
     async def check_block_name_unique(
         self,
@@ -91,13 +105,11 @@ class GeographyService:
         exclude_id: Optional[int] = None,
     ) -> bool:
         """Check if block name is unique within a district."""
-        query = select(Block).where(Block.name == name, Block.district_id == district_id)
+        condition = exists().where(Block.name == name, Block.district_id == district_id)
         if exclude_id:
-            query = query.where(Block.id != exclude_id)
+            condition = condition.where(Block.id != exclude_id)
 
-        result = await self.db.execute(query)
-        existing = result.scalar_one_or_none()
-        return existing is None
+        return not await self.db.scalar(select(condition))
 
     async def check_village_name_unique(
         self,
@@ -106,13 +118,11 @@ class GeographyService:
         exclude_id: Optional[int] = None,
     ) -> bool:
         """Check if village name is unique within a block."""
-        query = select(GramPanchayat).where(GramPanchayat.name == name, GramPanchayat.block_id == block_id)
+        condition = exists().where(GramPanchayat.name == name, GramPanchayat.block_id == block_id)
         if exclude_id:
-            query = query.where(GramPanchayat.id != exclude_id)
+            condition = condition.where(GramPanchayat.id != exclude_id)
 
-        result = await self.db.execute(query)
-        existing = result.scalar_one_or_none()
-        return existing is None
+        return not await self.db.scalar(select(condition))
 
     async def check_village_name_unique_in_gp(
         self,
@@ -121,71 +131,59 @@ class GeographyService:
         exclude_id: Optional[int] = None,
     ) -> bool:
         """Check if village name is unique within a Gram Panchayat."""
-        query = select(Village).where(Village.name == name, Village.gp_id == gp_id)
+        condition = exists().where(Village.name == name, Village.gp_id == gp_id)
         if exclude_id:
-            query = query.where(Village.id != exclude_id)
+            condition = condition.where(Village.id != exclude_id)
 
-        result = await self.db.execute(query)
-        existing = result.scalar_one_or_none()
-        return existing is None
+        return not await self.db.scalar(select(condition))
 
     async def can_delete_district(self, district_id: int) -> bool:
         """Check if a district can be safely deleted."""
-        # Check for blocks
-        blocks_result = await self.db.execute(select(func.count(Block.id)).where(Block.district_id == district_id))
-        blocks_count = blocks_result.scalar() or 0
-
-        # Check for complaints
-        complaints_result = await self.db.execute(
-            select(func.count(Complaint.id)).where(Complaint.district_id == district_id)
+        # EXISTS stops at the first dependent block or complaint
+        has_dependents = await self.db.scalar(
+            select(
+                or_(
+                    exists().where(Block.district_id == district_id),
+                    exists().where(Complaint.district_id == district_id),
+                )
+            )
         )
-        complaints_count = complaints_result.scalar() or 0
-
-        return blocks_count == 0 and complaints_count == 0
+        return not has_dependents
 
     async def can_delete_block(self, block_id: int) -> bool:
         """Check if a block can be safely deleted."""
-        # Check for villages
-        villages_result = await self.db.execute(
-            select(func.count(GramPanchayat.id)).where(GramPanchayat.block_id == block_id)
-        )
-        villages_count = villages_result.scalar() or 0
-
-        # Check for complaints
-        complaints_result = await self.db.execute(
-            select(func.count(Complaint.id)).where(Complaint.block_id == block_id)
+        # EXISTS stops at the first dependent village or complaint
+        has_dependents = await self.db.scalar(
+            select(
+                or_(
+                    exists().where(GramPanchayat.block_id == block_id),
+                    exists().where(Complaint.block_id == block_id),
+                )
+            )
         )
-        complaints_count = complaints_result.scalar() or 0
-
-        return villages_count == 0 and complaints_count == 0
+        return not has_dependents
 
     async def can_delete_village(self, village_id: int) -> bool:
         """Check if a village can be safely deleted."""
-        # Check for complaints
-        complaints_result = await self.db.execute(select(func.count(Complaint.id)).where(Complaint.gp_id == village_id))
-        complaints_count = complaints_result.scalar() or 0
-
-        return complaints_count == 0
+        has_complaints = await self.db.scalar(select(exists().where(Complaint.gp_id == village_id)))
+        return not has_complaints
 
     async def get_district_with_counts(self, district_id: int) -> Dict[str, Any]:
         """Get district with associated counts."""
-        district = await self.validate_district_exists(district_id)
-
-        # Count blocks
-        blocks_result = await self.db.execute(select(func.count(Block.id)).where(Block.district_id == district_id))
-        blocks_count = blocks_result.scalar() or 0
-
-        # Count villages
-        villages_result = await self.db.execute(
-            select(func.count(GramPanchayat.id)).where(GramPanchayat.district_id == district_id)
-        )
-        villages_count = villages_result.scalar() or 0
-
-        # Count complaints
-        complaints_result = await self.db.execute(
-            select(func.count(Complaint.id)).where(Complaint.district_id == district_id)
-        )
-        complaints_count = complaints_result.scalar() or 0
+        # Load the district and its blocks, villages and complaints counts in a single round-trip
+        row = (
+            await self.db.execute(
+                select(
+                    District,
+                    _count_where(Block, Block.district_id == District.id),
+                    _count_where(GramPanchayat, GramPanchayat.district_id == District.id),
+                    _count_where(Complaint, Complaint.district_id == District.id),
+                ).where(District.id == district_id)
+            )
+        ).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=400, detail="District not found")
+        district, blocks_count, villages_count, complaints_count = row
 
         return {
             "district": district,
@@ -196,19 +194,19 @@ class GeographyService:
 
     async def get_block_with_counts(self, block_id: int) -> Dict[str, Any]:
         """Get block with associated counts."""
-        block = await self.validate_block_exists(block_id)
-
-        # Count villages
-        villages_result = await self.db.execute(
-            select(func.count(GramPanchayat.id)).where(GramPanchayat.block_id == block_id)
-        )
-        villages_count = villages_result.scalar() or 0
-
-        # Count complaints
-        complaints_result = await self.db.execute(
-            select(func.count(Complaint.id)).where(Complaint.block_id == block_id)
-        )
-        complaints_count = complaints_result.scalar() or 0
+        # Load the block and its villages and complaints counts in a single round-trip
+        row = (
+            await self.db.execute(
+                select(
+                    Block,
+                    _count_where(GramPanchayat, GramPanchayat.block_id == Block.id),
+                    _count_where(Complaint, Complaint.block_id == Block.id),
+                ).where(Block.id == block_id)
+            )
+        ).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=400, detail="Block not found")
+        block, villages_count, complaints_count = row
 
         return {
             "block": block,
@@ -243,11 +241,20 @@ class GeographyService:
 
     async def get_village_with_counts(self, village_id: int) -> Dict[str, Any]:
         """Get village with associated counts."""
-        village = await self.validate_village_exists(village_id)
-
-        # Count complaints
-        complaints_result = await self.db.execute(select(func.count(Complaint.id)).where(Complaint.gp_id == village_id))
-        complaints_count = complaints_result.scalar() or 0
+        # Load the village and its complaints count in a single round-trip
+        row = (
+            await self.db.execute(
+                select(GramPanchayat, _count_where(Complaint, Complaint.gp_id == GramPanchayat.id))
+                .options(
+                    selectinload(GramPanchayat.block),
+                    selectinload(GramPanchayat.district),
+                )
+                .where(GramPanchayat.id == village_id)
+            )
+        ).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=400, detail="Village not found")
+        village, complaints_count = row
 
         return {
             "village": village,
@@ -316,65 +323,70 @@ class GeographyService:
 
     async def create_district(self, district_req: CreateDistrictRequest) -> District:
         """Create a new district."""
-        is_unique = await self.check_district_name_unique(district_req.name)
-        if not is_unique:
-            print(f"District name must be unique: {district_req.name}")
+        # ON CONFLICT lets the unique index reject duplicates atomically, without a pre-check query
+        new_district = (
+            await self.db.execute(
+                pg_insert(District)
+                .values(name=district_req.name, description=district_req.description)
+                .on_conflict_do_nothing(index_elements=[District.name])
+                .returning(District)
+            )
+        ).scalar_one_or_none()
+        if new_district is None:
             raise HTTPException(status_code=400, detail="District name must be unique")
-
-        new_district = await self.db.execute(
-            insert(District).values(name=district_req.name, description=district_req.description).returning(District)
-        )
         await self.db.commit()
-        return new_district.scalar_one()
+        return new_district
 
     async def create_block(self, block_req: CreateBlockRequest) -> Block:
         """Create a new block."""
         # Validate district exists
         await self.validate_district_exists(block_req.district_id)
 
-        is_unique = await self.check_block_name_unique(block_req.name, block_req.district_id)
-        if not is_unique:
+        new_block = (
+            await self.db.execute(
+                pg_insert(Block)
+                .values(
+                    name=block_req.name,
+                    description=block_req.description,
+                    district_id=block_req.district_id,
+                )
+                .on_conflict_do_nothing(constraint="uq_block_name_district")
+                .returning(Block)
+            )
+        ).scalar_one_or_none()
+        if new_block is None:
             raise HTTPException(
                 status_code=400,
                 detail="Block name must be unique within the district",
             )
-
-        new_block = await self.db.execute(
-            insert(Block)
-            .values(
-                name=block_req.name,
-                description=block_req.description,
-                district_id=block_req.district_id,
-            )
-            .returning(Block)
-        )
         await self.db.commit()
-        return new_block.scalar_one()
+        return new_block
 
     async def create_gp(self, village_req: CreateGPRequest) -> GramPanchayat:
         """Create a new gram panchayat."""
         # Validate block and district exist
         await self.validate_block_exists(village_req.block_id, village_req.district_id)
 
-        is_unique = await self.check_village_name_unique(village_req.name, village_req.block_id)
-        if not is_unique:
+        new_village = (
+            await self.db.execute(
+                pg_insert(GramPanchayat)
+                .values(
+                    name=village_req.name,
+                    description=village_req.description,
+                    block_id=village_req.block_id,
+                    district_id=village_req.district_id,
+                )
+                .on_conflict_do_nothing(constraint="uq_village_name_block")
+                .returning(GramPanchayat)
+            )
+        ).scalar_one_or_none()
+        if new_village is None:
             raise HTTPException(
                 status_code=400,
                 detail="Village name must be unique within the block",
             )
-
-        new_village = await self.db.execute(
-            insert(GramPanchayat)
-            .values(
-                name=village_req.name,
-                description=village_req.description,
-                block_id=village_req.block_id,
-                district_id=village_req.district_id,
-            )
-            .returning(GramPanchayat)
-        )
         await self.db.commit()
-        return new_village.scalar_one()
+        return new_village
 
     async def create_village(self, village_req: CreateVillageRequest) -> Village:
         """Create a new village in the villages table."""
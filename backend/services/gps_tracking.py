@@ -2,23 +2,56 @@
 
 import logging
 import asyncio
+import random
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from fastapi import HTTPException
 import httpx
-import requests
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import insert, select, distinct, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select, distinct, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import contains_eager
 
 from config import settings
 from models.database.geography import Block, District, GramPanchayat
-from models.database.gps import GPSRecord, GPSTracking, Vehicle
+from models.database.gps import GPSRecord, GPSTracking, Vehicle, VehicleLatestPosition
 from models.response.gps import CoordinatesResponse, RunningVehiclesResponse
 
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are streamed with COPY instead of an executemany INSERT
+_COPY_THRESHOLD = 100
+_GPS_RECORD_COLUMNS = (
+    "vehicle_id",
+    "latitude",
+    "longitude",
+    "speed",
+    "ignition",
+    "total_gps_odometer",
+    "timestamp",
+)
+_GPS_RECORD_STAGING_TABLE = "gps_records_staging"
+
+# Built once at import so each lookup reuses the cached compiled form
+_VEHICLE_BY_NO = select(Vehicle).where(Vehicle.vehicle_no == bindparam("vehicle_no"))
+
+
+def _parse_trackverse_timestamp(value: str) -> datetime:
+    """Parse a Trackverse "DD-MM-YYYY HH:MM:SS" timestamp using fixed offsets (much cheaper than strptime)."""
+    if len(value) != 19:
+        raise ValueError(f"Invalid Trackverse timestamp: {value!r}")
+    return datetime(
+        int(value[6:10]),
+        int(value[3:5]),
+        int(value[0:2]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+    )
+
 
 class GPSTrackingService:
     """Service for GPS tracking operations."""
@@ -27,16 +60,68 @@ class GPSTrackingService:
     TRACKVERSE_API_KEY = settings.trackverse_api_key
     TRACKVERSE_USERNAME = settings.trackverse_username
     TRACKVERSE_PASSWORD = settings.trackverse_password
+    # Static credentials, so the request headers are built once
+    _HEADERS = {
+        "accept": "application/json",
+        "api-key": TRACKVERSE_API_KEY,
+        "username": TRACKVERSE_USERNAME,
+        "pass": TRACKVERSE_PASSWORD,
+    }
     FETCH_INTERVAL_SECONDS = 30  # Fetch GPS data every 30 seconds
+    MAX_ROUTE_POINTS_PER_VEHICLE = 500  # Most recent points returned per vehicle route
+    MAX_VEHICLE_DETAIL_ROWS = 10000  # Route points per vehicle details request; older points are trimmed past this
     _consecutive_failures = 0
     _MAX_BACKOFF_SECONDS = 300  # Max 5 minutes between retries on persistent failures
 
+    _SAVE_QUEUE_SIZE = 4  # Fetched batches allowed to wait for the database before polling pauses
+
     _background_task = None
     _should_stop = False
+    _poller_lock = asyncio.Lock()
+    _stop_event: Optional[asyncio.Event] = None
+    # Last reported timestamp per vehicle number, to skip re-inserting unchanged positions
+    _last_seen: Dict[str, datetime] = {}
+    # vehicle_no -> vehicle id, shared across polls since the fleet rarely changes
+    _vehicle_ids: Dict[str, int] = {}
+    # Reported numbers with no registered vehicle; re-checked by number, not by a fleet reload
+    _unknown_vehicle_nos: Set[Optional[str]] = set()
+    _vehicle_ids_loaded_at = 0.0
+    _unknown_checked_at = 0.0
+    _VEHICLE_CACHE_TTL_SECONDS = 300
+    # Half the poll interval, so timing jitter between polls cannot skip a re-check
+    _UNKNOWN_VEHICLE_RETRY_SECONDS = FETCH_INTERVAL_SECONDS / 2
+    _http_client: Optional[httpx.AsyncClient] = None
+
+    # Circuit breaker around the Trackverse call: "closed" -> "open" after
+    # _CB_FAILURE_THRESHOLD failures, "half_open" lets one probe through after the cool-off
+    _CB_FAILURE_THRESHOLD = 5
+    _CB_BASE_COOL_OFF_SECONDS = 60
+    _cb_state = "closed"
+    _cb_opened_at = 0.0
+    _cb_cool_off = _CB_BASE_COOL_OFF_SECONDS
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
+    @classmethod
+    def _get_http_client(cls) -> httpx.AsyncClient:
+        """Return the shared Trackverse HTTP client, creating it on first use."""
+        if cls._http_client is None or cls._http_client.is_closed:
+            # Only one Trackverse request is in flight at a time; keep a couple of
+            # connections alive so each poll skips the TCP/TLS handshake.
+            cls._http_client = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=120),
+            )
+        return cls._http_client
+
+    @classmethod
+    async def close_http_client(cls) -> None:
+        """Close the shared Trackverse HTTP client."""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
     async def get_vehicle_by_number(self, vehicle_no: str) -> Optional[Vehicle]:
         """
         Get vehicle by its registration number.
@@ -47,7 +132,7 @@ class GPSTrackingService:
         Returns:
             Vehicle or None if not found
         """
-        result = await self.db.execute(select(Vehicle).where(Vehicle.vehicle_no == vehicle_no))
+        result = await self.db.execute(_VEHICLE_BY_NO, {"vehicle_no": vehicle_no})
         return result.scalar_one_or_none()
 
     async def fetch_and_save_gps_data(self) -> Dict[str, Any]:
@@ -57,18 +142,29 @@ class GPSTrackingService:
         Returns:
             dict: Status of the operation
         """
-        try:
-            # Fetch data from Trackverse API (async)
-            headers = {
-                "accept": "application/json",
-                "api-key": GPSTrackingService.TRACKVERSE_API_KEY,
-                "username": GPSTrackingService.TRACKVERSE_USERNAME,
-                "pass": GPSTrackingService.TRACKVERSE_PASSWORD,
-            }
+        fetched = await self.fetch_gps_data()
+        if not fetched["success"] or not fetched.get("devices"):
+            return {key: value for key, value in fetched.items() if key != "devices"}
+        return await self.save_gps_data(fetched["devices"])
+
+    @classmethod
+    async def fetch_gps_data(cls) -> Dict[str, Any]:
+        """
+        Fetch the current device positions from the Trackverse API.
 
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(GPSTrackingService.TRACKVERSE_API_URL, headers=headers)
-                response.raise_for_status()
+        Returns:
+            dict: Status of the operation, with the raw device list under "devices" on success
+        """
+        if not cls._circuit_allows_request():
+            return {"success": False, "message": "Trackverse circuit open, skipping fetch", "records_saved": 0}
+
+        try:
+            # Fetch data from Trackverse API (async).
+            # Reuse one client across polls so the TCP/TLS connection is kept alive
+            client = cls._get_http_client()
+            response = await client.get(GPSTrackingService.TRACKVERSE_API_URL, headers=GPSTrackingService._HEADERS)
+            response.raise_for_status()
+            cls._record_api_success()
 
             data = response.json()
 
@@ -82,34 +178,70 @@ class GPSTrackingService:
                 logger.warning("No GPS data received from API")
                 return {"success": True, "message": "No data to save", "records_saved": 0}
 
-            # Save to database
-            records_saved = 0
+            return {"success": True, "message": "Fetched GPS data", "records_saved": 0, "devices": devices_data}
+
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            GPSTrackingService._consecutive_failures += 1
+            cls._record_api_failure()
+            # Only log every 10th failure to avoid flooding logs
+            if GPSTrackingService._consecutive_failures <= 3 or GPSTrackingService._consecutive_failures % 10 == 0:
+                logger.error("Error fetching GPS data from API (failure #%d): %s", GPSTrackingService._consecutive_failures, e)
+            return {"success": False, "message": f"Failed to fetch data from API: {str(e)}", "records_saved": 0}
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Unexpected error in fetch_gps_data: %s", e)
+            return {"success": False, "message": f"Unexpected error: {str(e)}", "records_saved": 0}
+
+    async def save_gps_data(self, devices_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Save a batch of Trackverse device positions to the database.
+
+        Args:
+            devices_data: Raw device entries from the Trackverse API
+
+        Returns:
+            dict: Status of the operation
+        """
+        try:
+            vehicle_ids = await self._get_vehicle_ids({device.get("vehicleNo") for device in devices_data})
+
+            rows: List[Dict[str, Any]] = []
+            seen: Dict[str, datetime] = {}
+            last_seen = GPSTrackingService._last_seen
             for device in devices_data:
+                # Read each field once; a missing key lands in the per-record except below
+                vehicle_no = device.get("vehicleNo")
                 try:
                     # Parse timestamp from "30-10-2025 14:57:35" format
-                    timestamp_str = device.get("timestamp")
-                    timestamp = datetime.strptime(timestamp_str, "%d-%m-%Y %H:%M:%S")
-                    vehicle = await self.get_vehicle_by_number(device.get("vehicleNo"))
-                    if not vehicle:
-                        logger.warning("Vehicle with number %s not found, skipping record", device.get("vehicleNo"))
+                    timestamp = _parse_trackverse_timestamp(device["timestamp"])
+                    # Trackverse keeps returning the last fix until the device reports again
+                    if last_seen.get(vehicle_no) == timestamp:
+                        continue
+                    vehicle_id = vehicle_ids.get(vehicle_no)
+                    if vehicle_id is None:
+                        logger.warning("Vehicle with number %s not found, skipping record", vehicle_no)
                         continue
-                    assert vehicle, "Vehicle should not be None here"
-                    gps_record = GPSRecord(
-                        vehicle_id=vehicle.id,
-                        latitude=float(device.get("latitude")),
-                        longitude=float(device.get("longitude")),
-                        speed=float(device.get("speed")),
-                        ignition=bool(device.get("ignition")),
-                        total_gps_odometer=float(device.get("totalGpsOdometer")),
-                        timestamp=timestamp,
+                    rows.append(
+                        {
+                            "vehicle_id": vehicle_id,
+                            "latitude": float(device["latitude"]),
+                            "longitude": float(device["longitude"]),
+                            "speed": float(device["speed"]),
+                            "ignition": bool(device.get("ignition")),
+                            "total_gps_odometer": float(device["totalGpsOdometer"]),
+                            "timestamp": timestamp,
+                        }
                     )
-                    self.db.add(gps_record)
-                    records_saved += 1
+                    seen[vehicle_no] = timestamp
                 except Exception as e:  # pylint: disable=broad-except
-                    logger.error("Error saving GPS record for vehicle %s: %s", device.get("vehicleNo"), e)
+                    logger.error("Error saving GPS record for vehicle %s: %s", vehicle_no, e)
                     continue
 
+            if rows:
+                await self._insert_gps_records(rows)
+                await self._upsert_latest_positions(rows)
             await self.db.commit()
+            GPSTrackingService._last_seen.update(seen)
+            records_saved = len(rows)
 
             logger.info("Successfully saved %d GPS records", records_saved)
             return {
@@ -118,62 +250,254 @@ class GPSTrackingService:
                 "records_saved": records_saved,
             }
 
-        except (requests.RequestException, httpx.HTTPStatusError, httpx.RequestError) as e:
-            GPSTrackingService._consecutive_failures += 1
-            # Only log every 10th failure to avoid flooding logs
-            if GPSTrackingService._consecutive_failures <= 3 or GPSTrackingService._consecutive_failures % 10 == 0:
-                logger.error("Error fetching GPS data from API (failure #%d): %s", GPSTrackingService._consecutive_failures, e)
-            return {"success": False, "message": f"Failed to fetch data from API: {str(e)}", "records_saved": 0}
         except Exception as e:  # pylint: disable=broad-except
-            logger.error("Unexpected error in fetch_and_save_gps_data: %s", e)
+            logger.error("Unexpected error in save_gps_data: %s", e)
+            await self.db.rollback()
             return {"success": False, "message": f"Unexpected error: {str(e)}", "records_saved": 0}
 
-    async def start_periodic_fetch(self):
+    @classmethod
+    def _circuit_allows_request(cls) -> bool:
+        """Return False while the circuit is open; move to half-open once the cool-off has passed."""
+        if cls._cb_state != "open":
+            return True
+        if time.monotonic() - cls._cb_opened_at < cls._cb_cool_off:
+            return False
+        cls._cb_state = "half_open"
+        logger.info("Trackverse circuit half-open, sending a probe request")
+        return True
+
+    @classmethod
+    def _record_api_success(cls) -> None:
+        """Close the circuit after a successful Trackverse call."""
+        if cls._cb_state != "closed":
+            logger.info("Trackverse circuit closed")
+        cls._cb_state = "closed"
+        cls._cb_cool_off = cls._CB_BASE_COOL_OFF_SECONDS
+
+    @classmethod
+    def _record_api_failure(cls) -> None:
+        """Open the circuit on repeated failures, doubling the cool-off if a probe fails."""
+        if cls._cb_state == "half_open":
+            cls._cb_cool_off = min(cls._cb_cool_off * 2, cls._MAX_BACKOFF_SECONDS)
+        elif cls._consecutive_failures < cls._CB_FAILURE_THRESHOLD:
+            return
+        if cls._cb_state != "open":
+            logger.warning("Trackverse circuit open for %ds", cls._cb_cool_off)
+        cls._cb_state = "open"
+        cls._cb_opened_at = time.monotonic()
+
+    async def _get_vehicle_ids(self, vehicle_nos: Set[str]) -> Dict[str, int]:
+        """
+        Map vehicle numbers to vehicle ids, reloading the cached fleet when it is
+        stale or a reported number has not been seen since the last reload.
+
+        Vehicles are registered by the API process, so this cache cannot be invalidated
+        from there. Numbers known to be unregistered are re-checked on their own, at most
+        once per _UNKNOWN_VEHICLE_RETRY_SECONDS, so newly registered vehicles are picked up
+        within about one poll without reloading the whole fleet.
+        """
+        cls = GPSTrackingService
+        now = time.monotonic()
+        is_stale = now - cls._vehicle_ids_loaded_at > cls._VEHICLE_CACHE_TTL_SECONDS
+        if is_stale or vehicle_nos - cls._vehicle_ids.keys() - cls._unknown_vehicle_nos:
+            result = await self.db.execute(select(Vehicle.vehicle_no, Vehicle.id))
+            cls._vehicle_ids = dict(result.tuples().all())
+            cls._unknown_vehicle_nos = vehicle_nos - cls._vehicle_ids.keys()
+            cls._vehicle_ids_loaded_at = cls._unknown_checked_at = now
+        elif now - cls._unknown_checked_at >= cls._UNKNOWN_VEHICLE_RETRY_SECONDS:
+            pending = {vehicle_no for vehicle_no in vehicle_nos & cls._unknown_vehicle_nos if vehicle_no is not None}
+            if pending:
+                result = await self.db.execute(
+                    select(Vehicle.vehicle_no, Vehicle.id).where(Vehicle.vehicle_no.in_(pending))
+                )
+                registered = dict(result.tuples().all())
+                cls._vehicle_ids.update(registered)
+                cls._unknown_vehicle_nos -= registered.keys()
+            cls._unknown_checked_at = now
+        return cls._vehicle_ids
+
+    async def _insert_gps_records(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Write a poll's GPS rows in bulk, using COPY for large batches on asyncpg.
+
+        Rows already stored for the same (vehicle_id, timestamp) are skipped.
+        """
+        conn = await self.db.connection()
+        if len(rows) < _COPY_THRESHOLD or conn.dialect.driver != "asyncpg":
+            # One executemany INSERT instead of a unit-of-work flush per record
+            stmt = pg_insert(GPSRecord).on_conflict_do_nothing(
+                index_elements=[GPSRecord.vehicle_id, GPSRecord.timestamp]
+            )
+            await self.db.execute(stmt, rows)
+            return
+
+        # COPY streams the batch in one payload, skipping per-statement parse/plan.
+        # COPY has no ON CONFLICT, so load a transaction-scoped staging table and
+        # move the rows across with a single deduplicating INSERT ... SELECT.
+        #
+        # Ordering matters: the asyncpg adapter only opens its transaction on the first
+        # statement executed through SQLAlchemy. The CREATE must therefore go through
+        # self.db.execute, so the COPY on the raw connection lands inside that same
+        # transaction (otherwise ON COMMIT DROP removes the table immediately) and
+        # commits or rolls back together with the latest-position upsert.
+        columns = ", ".join(_GPS_RECORD_COLUMNS)
+        await self.db.execute(
+            text(
+                f"CREATE TEMP TABLE {_GPS_RECORD_STAGING_TABLE} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {GPSRecord.__tablename__} WITH NO DATA"
+            )
+        )
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _GPS_RECORD_STAGING_TABLE,
+            records=[tuple(row[column] for column in _GPS_RECORD_COLUMNS) for row in rows],
+            columns=list(_GPS_RECORD_COLUMNS),
+        )
+        await self.db.execute(
+            text(
+                f"INSERT INTO {GPSRecord.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM {_GPS_RECORD_STAGING_TABLE} "
+                "ON CONFLICT (vehicle_id, timestamp) DO NOTHING"
+            )
+        )
+
+    async def _upsert_latest_positions(self, rows: List[Dict[str, Any]]) -> None:
+        """Advance vehicle_latest_positions to the newest of the given GPS rows."""
+        # ON CONFLICT cannot touch the same row twice in one statement, so keep one row per vehicle
+        latest: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            current = latest.get(row["vehicle_id"])
+            if current is None or row["timestamp"] > current["timestamp"]:
+                latest[row["vehicle_id"]] = row
+
+        stmt = pg_insert(VehicleLatestPosition).values(list(latest.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VehicleLatestPosition.vehicle_id],
+            set_={
+                "latitude": stmt.excluded.latitude,
+                "longitude": stmt.excluded.longitude,
+                "speed": stmt.excluded.speed,
+                "ignition": stmt.excluded.ignition,
+                "total_gps_odometer": stmt.excluded.total_gps_odometer,
+                "timestamp": stmt.excluded.timestamp,
+            },
+            where=stmt.excluded.timestamp > VehicleLatestPosition.timestamp,
+        )
+        await self.db.execute(stmt)
+
+    @classmethod
+    async def start_periodic_fetch(cls, session_factory: Callable[[], AsyncSession]):
         """
         Start periodic GPS data fetching in the background.
         This runs every FETCH_INTERVAL_SECONDS.
+
+        Polling Trackverse and writing to the database run as separate tasks joined by a
+        bounded queue, so a slow database write does not delay the next poll. If writes
+        fall further behind than the queue allows, polling waits for them to catch up.
+
+        Args:
+            session_factory: Session maker used to open a fresh session per saved batch
         """
-        GPSTrackingService._should_stop = False
-        logger.info("Starting periodic GPS data fetch (every %d seconds)", GPSTrackingService.FETCH_INTERVAL_SECONDS)
+        # Never run two pollers at once; a second call would double the Trackverse load
+        if GPSTrackingService._poller_lock.locked():
+            logger.warning("Periodic GPS fetch is already running, not starting another")
+            return
+
+        async with GPSTrackingService._poller_lock:
+            GPSTrackingService._should_stop = False
+            GPSTrackingService._stop_event = asyncio.Event()
+            logger.info(
+                "Starting periodic GPS data fetch (every %d seconds)", GPSTrackingService.FETCH_INTERVAL_SECONDS
+            )
 
-        while not GPSTrackingService._should_stop:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=GPSTrackingService._SAVE_QUEUE_SIZE)
+            await asyncio.gather(cls._produce_gps_batches(queue), cls._consume_gps_batches(queue, session_factory))
+
+    @classmethod
+    async def _produce_gps_batches(cls, queue: asyncio.Queue) -> None:
+        """Poll Trackverse until stopped, queueing each device batch for saving."""
+        try:
+            while not GPSTrackingService._should_stop:
+                started = time.monotonic()
+                try:
+                    result = await cls.fetch_gps_data()
+                    if result.get("success"):
+                        GPSTrackingService._consecutive_failures = 0
+                        if result.get("devices"):
+                            await queue.put(result["devices"])
+                        else:
+                            logger.info("Periodic GPS fetch result: %s", result.get("message"))
+                except Exception as e:  # pylint: disable=broad-except
+                    GPSTrackingService._consecutive_failures += 1
+                    logger.error("Error in periodic GPS fetch: %s", e)
+
+                # Exponential backoff on persistent failures, capped at _MAX_BACKOFF_SECONDS.
+                # The exponent is capped too, and +/-50% jitter keeps retries from
+                # hitting a recovering upstream in lockstep.
+                if GPSTrackingService._consecutive_failures > 3:
+                    exponent = min(GPSTrackingService._consecutive_failures - 3, 10)
+                    backoff = min(
+                        GPSTrackingService.FETCH_INTERVAL_SECONDS * (2 ** exponent) * (0.5 + random.random()),
+                        GPSTrackingService._MAX_BACKOFF_SECONDS,
+                    )
+                    logger.warning("GPS API failing repeatedly (%d failures), backing off to %.0fs",
+                                   GPSTrackingService._consecutive_failures, backoff)
+                    await cls._wait_for_next_fetch(backoff)
+                else:
+                    # Count the fetch itself against the interval so polls keep a steady cadence
+                    elapsed = time.monotonic() - started
+                    await cls._wait_for_next_fetch(max(0.0, GPSTrackingService.FETCH_INTERVAL_SECONDS - elapsed))
+        finally:
+            # Tell the consumer to finish the queued batches and exit
+            await queue.put(None)
+
+    @classmethod
+    async def _consume_gps_batches(cls, queue: asyncio.Queue, session_factory: Callable[[], AsyncSession]) -> None:
+        """Save queued device batches, each in its own short-lived session."""
+        while True:
+            devices_data = await queue.get()
             try:
-                result = await self.fetch_and_save_gps_data()
-                if result.get("success"):
-                    GPSTrackingService._consecutive_failures = 0
-                    logger.info("Periodic GPS fetch result: %s", result.get("message"))
+                if devices_data is None:
+                    return
+                async with session_factory() as db:
+                    result = await cls(db).save_gps_data(devices_data)
+                logger.info("Periodic GPS fetch result: %s", result.get("message"))
             except Exception as e:  # pylint: disable=broad-except
-                GPSTrackingService._consecutive_failures += 1
-                logger.error("Error in periodic GPS fetch: %s", e)
-
-            # Exponential backoff on persistent failures, capped at _MAX_BACKOFF_SECONDS
-            if GPSTrackingService._consecutive_failures > 3:
-                backoff = min(
-                    GPSTrackingService.FETCH_INTERVAL_SECONDS * (2 ** (GPSTrackingService._consecutive_failures - 3)),
-                    GPSTrackingService._MAX_BACKOFF_SECONDS
-                )
-                logger.warning("GPS API failing repeatedly (%d failures), backing off to %ds",
-                               GPSTrackingService._consecutive_failures, backoff)
-                await asyncio.sleep(backoff)
-            else:
-                await asyncio.sleep(GPSTrackingService.FETCH_INTERVAL_SECONDS)
+                logger.error("Error saving periodic GPS batch: %s", e)
+            finally:
+                queue.task_done()
+
+    @classmethod
+    async def _wait_for_next_fetch(cls, seconds: float) -> None:
+        """Sleep until the next fetch, waking early if stop_periodic_fetch is called."""
+        assert cls._stop_event is not None
+        try:
+            await asyncio.wait_for(cls._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
 
-    def stop_periodic_fetch(self):
+    @classmethod
+    def stop_periodic_fetch(cls):
         """Stop the periodic GPS data fetching."""
         logger.info("Stopping periodic GPS data fetch")
-        GPSTrackingService._should_stop = True
+        cls._should_stop = True
+        # Wake the loop out of its sleep so shutdown does not wait for the interval
+        if cls._stop_event is not None:
+            cls._stop_event.set()
 
     async def get_unique_vehicles(self) -> List[str]:
         """
-        Get list of unique vehicle numbers from GPS tracking data.
-
-        Args:
-            db: Database session
+        Get list of unique vehicle numbers that have reported GPS data.
 
         Returns:
             List of unique vehicle numbers
         """
-        result = await self.db.execute(select(distinct(GPSTracking.vehicle_no)).order_by(GPSTracking.vehicle_no))
+        # One row per tracked vehicle, so this no longer scans the GPS history
+        result = await self.db.execute(
+            select(distinct(Vehicle.vehicle_no))
+            .join(VehicleLatestPosition, VehicleLatestPosition.vehicle_id == Vehicle.id)
+            .order_by(Vehicle.vehicle_no)
+        )
         vehicles = result.scalars().all()
         return [str(v) for v in vehicles]
 
@@ -203,40 +527,27 @@ class GPSTrackingService:
 
     async def get_latest_vehicle_positions(
         self, vehicle_nos: Optional[List[str]] = None, limit: int = 1000
-    ) -> List[GPSTracking]:
+    ) -> List[VehicleLatestPosition]:
         """
         Get the latest position for each vehicle.
 
         Args:
-            db: Database session
             vehicle_nos: Optional list of vehicle numbers to filter
+            limit: Maximum number of vehicles to return
 
         Returns:
-            List of latest GPS tracking records for each vehicle
+            List of latest positions, with the related vehicle loaded
         """
-        # This is a simplified version - for better performance, you might want to use
-        # a window function or subquery to get the latest record per vehicle
-
-        # Subquery to get the latest timestamp for each vehicle
-        subquery = select(GPSTracking.vehicle_no, func.max(GPSTracking.timestamp).label("max_timestamp")).group_by(
-            GPSTracking.vehicle_no
-        )
-        subquery = subquery.limit(limit)
-
-        if vehicle_nos:
-            subquery = subquery.where(GPSTracking.vehicle_no.in_(vehicle_nos))
-
-        subquery = subquery.subquery()
-
-        # Main query to get full records
+        # Positions are maintained on ingest, so this is one row per vehicle
+        # instead of a scan over the GPS history.
         query = (
-            select(GPSTracking)
-            .join(
-                subquery,
-                (GPSTracking.vehicle_no == subquery.c.vehicle_no) & (GPSTracking.timestamp == subquery.c.max_timestamp),
-            )
-            .order_by(GPSTracking.vehicle_no)
+            select(VehicleLatestPosition)
+            .join(Vehicle, VehicleLatestPosition.vehicle_id == Vehicle.id)
+            .options(contains_eager(VehicleLatestPosition.vehicle))
         )
+        if vehicle_nos:
+            query = query.where(Vehicle.vehicle_no.in_(vehicle_nos))
+        query = query.order_by(Vehicle.vehicle_no).limit(limit)
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
@@ -254,22 +565,23 @@ class GPSTrackingService:
         Returns:
             The created GPSTracking record
         """
-        # Check if a vehicle with the same vehicle_no and gp_id already exists
-        existing_vehicle = await self.get_vehicles(vehicle_no=vehicle_no)
-        if existing_vehicle:
-            raise HTTPException(status_code=400, detail=f"Vehicle with number {vehicle_no} already exists.")
+        # The unique index on vehicle_no rejects duplicates, including concurrent
+        # registrations under different GPs, without a separate existence query
         new_vehicle = (
             await self.db.execute(
-                insert(Vehicle)
+                pg_insert(Vehicle)
                 .values(  # type: ignore
                     vehicle_no=vehicle_no,
                     imei=imei,
                     gp_id=gp_id,
                     name=name,
                 )
+                .on_conflict_do_nothing(index_elements=[Vehicle.vehicle_no])
                 .returning(Vehicle)
             )
-        ).scalar_one()
+        ).scalar_one_or_none()
+        if new_vehicle is None:
+            raise HTTPException(status_code=400, detail=f"Vehicle with number {vehicle_no} already exists.")
         await self.db.commit()
         return new_vehicle
 
@@ -292,10 +604,11 @@ class GPSTrackingService:
         """
         query = (
             select(Vehicle)
-            .options(selectinload(Vehicle.gp).selectinload(GramPanchayat.block).selectinload(Block.district))
             .join(GramPanchayat, Vehicle.gp_id == GramPanchayat.id)
             .join(Block, GramPanchayat.block_id == Block.id)
             .join(District, Block.district_id == District.id)
+            # Populate gp -> block -> district from the joined rows instead of three SELECT INs
+            .options(contains_eager(Vehicle.gp).contains_eager(GramPanchayat.block).contains_eager(Block.district))
         )
 
         if district_id:
@@ -331,58 +644,91 @@ class GPSTrackingService:
         if not start_time:
             start_time = now - timedelta(minutes=300)
         end_time = end_time or now
-        print(f"Start time: {start_time}, End time: {end_time}")
-
-        # Eager-load the related Vehicle to avoid lazy-loading (which triggers DB IO
-        # outside the async context and results in MissingGreenlet errors).
-        vehicles_query = (
-            select(GPSRecord)
-            .options(selectinload(GPSRecord.vehicle))
+        logger.debug("Vehicle details window: %s - %s", start_time, end_time)
+
+        # Rank each vehicle's records newest-first in SQL and select plain columns,
+        # so only the points we return cross the wire and no ORM objects are built.
+        ranked = (
+            select(
+                Vehicle.id.label("vehicle_id"),
+                Vehicle.vehicle_no,
+                Vehicle.name,
+                GPSRecord.latitude,
+                GPSRecord.longitude,
+                GPSRecord.speed,
+                GPSRecord.timestamp,
+                func.row_number()
+                .over(partition_by=GPSRecord.vehicle_id, order_by=GPSRecord.timestamp.desc())
+                .label("rn"),
+            )
             .join(Vehicle, GPSRecord.vehicle_id == Vehicle.id)
             .join(GramPanchayat, Vehicle.gp_id == GramPanchayat.id)
             .join(Block, GramPanchayat.block_id == Block.id)
             .join(District, Block.district_id == District.id)
         )
         if district_id:
-            vehicles_query = vehicles_query.where(District.id == district_id)
+            ranked = ranked.where(District.id == district_id)
         if block_id:
-            vehicles_query = vehicles_query.where(Block.id == block_id)
+            ranked = ranked.where(Block.id == block_id)
         if gp_id:
-            vehicles_query = vehicles_query.where(GramPanchayat.id == gp_id)
-        # vehicles_query = vehicles_query.where(GPSRecord.timestamp >= start_time)
+            ranked = ranked.where(GramPanchayat.id == gp_id)
+        # ranked = ranked.where(GPSRecord.timestamp >= start_time)
         # if end_time:
-        #     vehicles_query = vehicles_query.where(GPSRecord.timestamp <= end_time)
-        vehicles_query = vehicles_query.order_by(Vehicle.id, GPSRecord.timestamp.desc())
-        vehicles_query = vehicles_query.limit(10000)  # Limit to 10,000 records to prevent overload
-        vehicles = await self.db.execute(vehicles_query)
-        # Let us print SQL for debugging with actual parameters
-        print(str(vehicles_query.compile(compile_kwargs={"literal_binds": True})))
-        vehicles = vehicles.scalars().all()
-        if len(vehicles) > 10000:
-            raise HTTPException(status_code=400, detail="Too many vehicles found, please narrow down your query.")
-        vehicle_details: List[RunningVehiclesResponse] = []
-        vehicle_id_to_index_map: Dict[int, int] = {}
-        for _, record in enumerate(vehicles):
-            if record.vehicle.id in vehicle_id_to_index_map:
-                vehicle_index = vehicle_id_to_index_map[record.vehicle.id]
-                vehicle_details[vehicle_index].route.append(
-                    CoordinatesResponse(lat=record.latitude, long=record.longitude)
-                )
-            else:
-                vehicle_id_to_index_map[record.vehicle.id] = len(vehicle_details)
-                vehicle_details.append(
-                    RunningVehiclesResponse(
-                        vehicle_id=record.vehicle.id,
-                        name=record.vehicle.name or f"Vehicle {record.vehicle.vehicle_no}",
-                        vehicle_no=record.vehicle.vehicle_no,
-                        status="Running" if record.speed > 0 else "Stopped",
-                        speed=record.speed,
-                        last_updated=record.timestamp,
-                        coordinates=CoordinatesResponse(lat=record.latitude, long=record.longitude),
-                        route=[
-                            CoordinatesResponse(lat=record.latitude, long=record.longitude)
-                        ],
-                    )
-                )
+        #     ranked = ranked.where(GPSRecord.timestamp <= end_time)
+        ranked = ranked.subquery()
 
-        return vehicle_details
+        vehicles_query = (
+            select(
+                ranked.c.vehicle_id,
+                ranked.c.vehicle_no,
+                ranked.c.name,
+                ranked.c.latitude,
+                ranked.c.longitude,
+                ranked.c.speed,
+                ranked.c.timestamp,
+            )
+            .where(ranked.c.rn <= GPSTrackingService.MAX_ROUTE_POINTS_PER_VEHICLE)
+            # Emit every vehicle's newest point, then every vehicle's second newest, and so on.
+            # If the cap is hit only the oldest route points are cut, never whole vehicles.
+            .order_by(ranked.c.rn, ranked.c.vehicle_id)
+            # One row past the cap tells us the result was truncated without fetching the rest
+            .limit(GPSTrackingService.MAX_VEHICLE_DETAIL_ROWS + 1)
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Rendering with literal binds recompiles the statement, so only do it when debugging
+            logger.debug("Vehicle details SQL: %s", vehicles_query.compile(compile_kwargs={"literal_binds": True}))
+        # Stream rows through a server-side cursor so only the grouped coordinates are held
+        # in memory, not the full result set. The LIMIT above already bounds the scan.
+        # Collect plain coordinates per vehicle first and build each response model once.
+        # Rows arrive newest-first within a vehicle, so the first row seen is the latest fix.
+        routes: Dict[int, List[tuple]] = defaultdict(list)
+        latest: Dict[int, Any] = {}
+        result = await self.db.stream(vehicles_query)
+        row_count = 0
+        async for record in result:
+            row_count += 1
+            if row_count > GPSTrackingService.MAX_VEHICLE_DETAIL_ROWS:
+                await result.close()
+                logger.warning(
+                    "Vehicle details capped at %d route points; older points were trimmed",
+                    GPSTrackingService.MAX_VEHICLE_DETAIL_ROWS,
+                )
+                break
+            routes[record.vehicle_id].append((record.latitude, record.longitude))
+            latest.setdefault(record.vehicle_id, record)
+
+        # Every value comes from typed columns, so skip Pydantic validation for the
+        # (potentially thousands of) route points and build the models directly.
+        return [
+            RunningVehiclesResponse.model_construct(
+                vehicle_id=vehicle_id,
+                name=record.name or f"Vehicle {record.vehicle_no}",
+                vehicle_no=record.vehicle_no,
+                status="Running" if record.speed > 0 else "Stopped",
+                speed=record.speed,
+                last_updated=record.timestamp,
+                coordinates=CoordinatesResponse.model_construct(lat=record.latitude, long=record.longitude),
+                route=[CoordinatesResponse.model_construct(lat=lat, long=long) for lat, long in routes[vehicle_id]],
+            )
+            for vehicle_id, record in latest.items()
+        ]